@@ -10,15 +10,203 @@ Date: 2025-01-27
 """
 
 import os
+import queue
 import shutil
+import sys
+import threading
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import DefaultDict, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+# Extensions handled for each category. Shared by every FileOrganizer
+# instance, so it is built once at import time and exposed read-only.
+_EXTENSIONS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'Images': ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.webp', '.ico'),
+    'Documents': ('.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt', '.xls', '.xlsx', '.ppt', '.pptx'),
+    'Videos': ('.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'),
+    'Audio': ('.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.wma'),
+    'Archives': ('.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'),
+    'Code': ('.py', '.js', '.html', '.css', '.java', '.cpp', '.c', '.php', '.rb', '.go'),
+    'Executables': ('.exe', '.msi', '.deb', '.rpm', '.dmg', '.app'),
+})
+
+# Flat extension -> category lookup table derived from _EXTENSIONS. Kept as a
+# plain dict: it is probed once per file, and a proxy's get() is slower.
+_EXT_TO_CATEGORY: Dict[str, str] = {
+    ext: category
+    for category, extensions in _EXTENSIONS.items()
+    for ext in extensions
+}
+
+# Every category in table order, including the 'Other' fallback
+_CATEGORIES: Tuple[str, ...] = tuple(_EXTENSIONS) + ('Other',)
+
+
+# Number of directory entries the --parallel-scan producer hands to a
+# worker at a time
+_SCAN_BLOCK_SIZE = 1000
+
+# Result of organize_files: file names per category, or only per-category
+# counts when counts_only is requested
+MovedFiles = Union[Dict[str, List[str]], Counter]
+
+# Default cap on renames in flight at once when moving files concurrently
+_DEFAULT_IO_BUDGET = min(os.cpu_count() or 1, 8)
+
+
+def _name_suffix(name: str) -> str:
+    """
+    Get the extension of a bare file name, with the same rules as Path.suffix.
+    
+    A leading dot marks a hidden file and a trailing dot an empty extension.
+    
+    Args:
+        name (str): File name, without any directory part
+        
+    Returns:
+        str: Extension including the dot, in its original case, or ''
+    """
+    dot = name.rfind('.')
+    return name[dot:] if 0 < dot < len(name) - 1 else ''
+
+
+def _categorize_name(name: str) -> str:
+    """
+    Categorize a file by name using the flat extension lookup table.
+    
+    Args:
+        name (str): File name, without any directory part
+        
+    Returns:
+        str: Category name for the file
+    """
+    extension = _name_suffix(name)
+    # Most extensions are already lowercase; only pay for lower() on a miss
+    category = _EXT_TO_CATEGORY.get(extension)
+    if category is None:
+        category = _EXT_TO_CATEGORY.get(extension.lower(), 'Other')
+    return category
+
+
+def _copy_moved_files(moved_files: MovedFiles) -> MovedFiles:
+    """
+    Copy an organize result so callers cannot mutate a cached one.
+    
+    Args:
+        moved_files (MovedFiles): Result of organize_files
+        
+    Returns:
+        MovedFiles: Independent copy of the result
+    """
+    if isinstance(moved_files, Counter):
+        return Counter(moved_files)
+    return defaultdict(list, {category: list(files) for category, files in moved_files.items()})
+
+
+def _move_no_replace(source: str, destination: str) -> bool:
+    """
+    Move a file unless something already has the destination name.
+    
+    The file is hard-linked at destination and its old name removed. Unlike a
+    rename, os.link fails with EEXIST instead of replacing what is there.
+    Where a hard link is not possible (another filesystem, or one without link
+    support), fall back to shutil.move once the name is seen to be free.
+    
+    Args:
+        source (str): Path of the file to move
+        destination (str): Full destination path, including the file name
+        
+    Returns:
+        bool: True if the file was moved, False if destination was taken
+    """
+    try:
+        os.link(source, destination)
+    except FileExistsError:
+        return False
+    except OSError:
+        if os.path.lexists(destination):
+            return False
+        shutil.move(source, destination)
+        return True
+    os.unlink(source)
+    return True
+
+
+def _move_to_unique_name(source: str, destination: str) -> str:
+    """
+    Move a file to the first free name made by appending _1, _2, ... to its stem.
+    
+    A numbered name is skipped while a file of that name is still waiting in
+    the source folder, since that file will be moved onto it later. A name
+    taken by another thread in the meantime is skipped too, as the move
+    itself never overwrites.
+    
+    Args:
+        source (str): Path of the file to move
+        destination (str): Destination path that is already taken
+        
+    Returns:
+        str: Path the file was actually moved to
+    """
+    source_dir = os.path.dirname(source)
+    stem, extension = os.path.splitext(destination)
+    counter = 0
+    while True:
+        counter += 1
+        candidate = f"{stem}_{counter}{extension}"
+        # Check the pending source before the destination: a concurrent move
+        # takes the file out of one only after it appears in the other
+        if (os.path.lexists(os.path.join(source_dir, os.path.basename(candidate)))
+                or os.path.lexists(candidate)):
+            continue
+        if _move_no_replace(source, candidate):
+            return candidate
+
+
+def _move_file(source: str, destination: str) -> str:
+    """
+    Move a file, never overwriting anything already at the destination.
+    
+    If destination is taken, by an earlier run's file or by a directory, the
+    file is moved to a numbered name next to it instead.
+    
+    Args:
+        source (str): Path of the file to move
+        destination (str): Full destination path, including the file name
+        
+    Returns:
+        str: Path the file was actually moved to
+    """
+    if _move_no_replace(source, destination):
+        return destination
+    return _move_to_unique_name(source, destination)
+
+
+def _move_file_limited(semaphore: threading.BoundedSemaphore, source: str, destination: str) -> str:
+    """
+    Move a file once a slot in the shared I/O budget is free.
+    
+    Args:
+        semaphore (threading.BoundedSemaphore): Semaphore bounding concurrent moves
+        source (str): Path of the file to move
+        destination (str): Full destination path, including the file name
+        
+    Returns:
+        str: Path the file was actually moved to
+    """
+    with semaphore:
+        return _move_file(source, destination)
 
 
 class FileOrganizer:
     """A class to organize files by their extensions."""
     
+    __slots__ = ('directory', '_file_extensions', '_dry_run_cache')
+    
     def __init__(self, directory: str):
         """
         Initialize the FileOrganizer.
@@ -27,31 +215,28 @@ class FileOrganizer:
             directory (str): The directory path to organize
         """
         self.directory = Path(directory)
-        self._file_extensions = {
-            'Images': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.webp', '.ico'],
-            'Documents': ['.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt', '.xls', '.xlsx', '.ppt', '.pptx'],
-            'Videos': ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'],
-            'Audio': ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.wma'],
-            'Archives': ['.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'],
-            'Code': ['.py', '.js', '.html', '.css', '.java', '.cpp', '.c', '.php', '.rb', '.go'],
-            'Executables': ['.exe', '.msi', '.deb', '.rpm', '.dmg', '.app']
-        }
+        self._file_extensions = _EXTENSIONS
+        # (directory, directory mtime in ns, counts_only, files found, result) of the last dry run
+        self._dry_run_cache: Optional[Tuple[str, int, bool, int, MovedFiles]] = None
     
     @property
     def file_extensions(self):
         """Return a copy of the file extensions dictionary."""
-        return {k: v.copy() for k, v in self._file_extensions.items()}
+        return {k: list(v) for k, v in self._file_extensions.items()}
     
-    def get_file_extension(self, file_path: Path) -> str:
+    def get_file_extension(self, file_path: Union[Path, str]) -> str:
         """
         Get the file extension in lowercase.
         
         Args:
-            file_path (Path): Path to the file
+            file_path (Union[Path, str]): Path to the file, or a bare file name
+                (no directory part), which skips Path parsing entirely
             
         Returns:
             str: File extension in lowercase
         """
+        if isinstance(file_path, str):
+            return _name_suffix(file_path).lower()
         return file_path.suffix.lower()
     
     def categorize_file(self, file_path: Path) -> str:
@@ -64,89 +249,446 @@ class FileOrganizer:
         Returns:
             str: Category name for the file
         """
-        extension = self.get_file_extension(file_path)
+        return self.categorize_name(file_path.name)
+    
+    def categorize_name(self, name: str) -> str:
+        """
+        Categorize a file from its bare name, without building a Path.
         
-        for category, extensions in self._file_extensions.items():
-            if extension in extensions:
-                return category
+        Args:
+            name (str): File name, without any directory part
+            
+        Returns:
+            str: Category name for the file
+        """
+        return _categorize_name(name)
+    
+    @staticmethod
+    def _ensure_category_dir(directory: str, category: str) -> str:
+        """
+        Create the folder for a category if it does not exist yet.
         
-        return 'Other'
+        Args:
+            directory (str): Directory being organized
+            category (str): Category whose folder is needed
+            
+        Returns:
+            str: Path of the category folder
+        """
+        folder = os.path.join(directory, category)
+        os.makedirs(folder, exist_ok=True)
+        return folder
     
     def create_category_folders(self) -> None:
         """Create folders for each file category."""
-        categories = list(self._file_extensions.keys()) + ['Other']
-        
-        for category in categories:
+        for category in _CATEGORIES:
             folder_path = self.directory / category
             folder_path.mkdir(exist_ok=True)
             print(f"Created folder: {category}")
     
-    def organize_files(self, dry_run: bool = False) -> Dict[str, List[str]]:
+    def organize_files(self, dry_run: bool = False, max_workers: int = 1,
+                       verbose: bool = False, parallel_scan: bool = False,
+                       io_budget: Optional[int] = None, counts_only: bool = False,
+                       quiet: bool = False) -> MovedFiles:
         """
         Organize files into their respective category folders.
         
         Args:
             dry_run (bool): If True, only show what would be moved without actually moving files
+            max_workers (int): Number of threads used to move files concurrently
+            verbose (bool): If True, report every file as it is moved
+            parallel_scan (bool): If True, start moving files while the directory
+                is still being read (see _organize_streaming)
+            io_budget (Optional[int]): Maximum number of concurrent moves when
+                max_workers > 1. Defaults to min(cpu_count, 8); use a low value
+                on network filesystems (NFS/SMB) to avoid saturating the server
+            counts_only (bool): If True, only count the files moved per category
+                instead of keeping every file name
+            quiet (bool): If True, do not print how many files the scan found
             
         Returns:
-            Dict[str, List[str]]: Dictionary with categories and moved files
+            MovedFiles: Dictionary with categories and moved files, or a Counter
+            of files per category when counts_only is True
         """
-        if not self.directory.exists():
-            raise FileNotFoundError(f"Directory {self.directory} does not exist")
+        # Only one of these is filled, depending on counts_only. Categories
+        # that receive no files never get an entry.
+        counts: Counter = Counter()
+        names: DefaultDict[str, List[str]] = defaultdict(list)
+        moved_files: MovedFiles = counts if counts_only else names
+        # Read once per call: directory may be reassigned between calls
+        directory = str(self.directory)
         
-        moved_files = {category: [] for category in list(self._file_extensions.keys()) + ['Other']}
+        if dry_run:
+            # A dry run only depends on the directory listing, which cannot have
+            # changed if the directory's mtime has not; reuse the last plan then
+            mtime = os.stat(directory).st_mtime_ns
+            cached = self._dry_run_cache
+            if cached is not None and cached[:3] == (directory, mtime, counts_only):
+                if not quiet:
+                    self._print_found(cached[3])
+                return _copy_moved_files(cached[4])
+        else:
+            # Moving files changes the directory, so any cached plan is stale
+            self._dry_run_cache = None
         
-        # Get all files in the directory (not subdirectories)
-        files = [f for f in self.directory.iterdir() if f.is_file()]
+        if io_budget is None:
+            io_budget = _DEFAULT_IO_BUDGET
+        elif io_budget < 1:
+            raise ValueError(f"io_budget must be at least 1, got {io_budget}")
+        semaphore = threading.BoundedSemaphore(io_budget)
         
-        if not files:
-            print("No files found to organize.")
+        if parallel_scan and not dry_run:
+            return self._organize_streaming(directory, max_workers, verbose, semaphore, counts_only, quiet)
+        
+        # Get all files in the directory (not subdirectories). DirEntry answers
+        # is_file() from the cached readdir data, so no per-file stat is needed.
+        with os.scandir(directory) as it:
+            entries = [entry for entry in it if entry.is_file(follow_symlinks=False)]
+        
+        if not quiet:
+            self._print_found(len(entries))
+        if not entries:
             return moved_files
         
-        print(f"Found {len(files)} files to organize...")
+        # Categorize everything up front so only the folders that will
+        # actually receive files need to be created. The per-file loops bind
+        # globals and bound methods to locals first.
+        plan: Dict[str, List[Tuple[str, str]]] = {category: [] for category in _CATEGORIES}
+        add_to_plan = {category: files.append for category, files in plan.items()}
+        categorize = _categorize_name
+        for entry in entries:
+            name = entry.name
+            add_to_plan[categorize(name)]((name, entry.path))
         
-        # Create category folders first (only if not dry run)
-        if not dry_run:
-            self.create_category_folders()
+        # Categories in table order, limited to the ones that have files
+        categories = [category for category in _CATEGORIES if plan[category]]
         
-        for file_path in files:
-            category = self.categorize_file(file_path)
-            destination = self.directory / category / file_path.name
-            
-            try:
-                if not dry_run:
-                    shutil.move(str(file_path), str(destination))
-                    moved_files[category].append(file_path.name)
-                    print(f"Moved: {file_path.name} -> {category}/")
+        if dry_run:
+            # Nothing touches the filesystem; print_summary reports the plan
+            for category in categories:
+                files = plan[category]
+                if counts_only:
+                    counts[category] = len(files)
                 else:
-                    moved_files[category].append(file_path.name)
-                    print(f"Would move: {file_path.name} -> {category}/")
-                    
-            except Exception as e:
-                print(f"Error moving {file_path.name}: {e}")
+                    names[category] = [name for name, _ in files]
+            self._dry_run_cache = (directory, mtime, counts_only, len(entries), _copy_moved_files(moved_files))
+            return moved_files
+        
+        # Moves are grouped by category, in table order, so each destination
+        # directory receives all of its renames back-to-back
+        planned_moves: List[Tuple[str, str, str, str]] = []
+        for category in categories:
+            dest_dir = self._ensure_category_dir(directory, category)
+            planned_moves.extend(
+                (category, name, source, os.path.join(dest_dir, name))
+                for name, source in plan[category]
+            )
+        
+        # Per-file lines are buffered and written in one go rather than
+        # paying for a print() call per file
+        lines = []
+        
+        if max_workers > 1:
+            # Renames release the GIL, so a thread pool overlaps their latency
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_move_file_limited, semaphore, source, destination):
+                        (category, name, destination)
+                    for category, name, source, destination in planned_moves
+                }
+                for future in as_completed(futures):
+                    category, name, destination = futures[future]
+                    try:
+                        moved_to = future.result()
+                        if moved_to != destination:
+                            name = os.path.basename(moved_to)
+                        if counts_only:
+                            counts[category] += 1
+                        else:
+                            names[category].append(name)
+                        if verbose:
+                            lines.append(f"Moved: {name} -> {category}/")
+                    except Exception as e:
+                        print(f"Error moving {name}: {e}")
+        else:
+            move_file = _move_file
+            basename = os.path.basename
+            add_line = lines.append
+            if not counts_only:
+                add_moved = {category: names[category].append for category in categories}
+            for category, name, source, destination in planned_moves:
+                try:
+                    moved_to = move_file(source, destination)
+                    if moved_to != destination:
+                        name = basename(moved_to)
+                    if counts_only:
+                        counts[category] += 1
+                    else:
+                        add_moved[category](name)
+                    if verbose:
+                        add_line(f"Moved: {name} -> {category}/")
+                except Exception as e:
+                    print(f"Error moving {name}: {e}")
         
+        self._write_lines(lines)
         return moved_files
     
-    def print_summary(self, moved_files: Dict[str, List[str]]) -> None:
+    @classmethod
+    def bulk_organize(cls, directories: List[str], workers: int = 4,
+                      dry_run: bool = False) -> Dict[str, Union[MovedFiles, Exception]]:
+        """
+        Organize several directories concurrently, one thread per directory.
+        
+        The extension tables are module-level and shared, so each per-directory
+        organizer costs next to nothing to set up. A directory listed more than
+        once (under any spelling of its path) is organized only once, and a
+        directory that fails does not stop the others. Each directory reports
+        one status line, naming it, once it is done.
+        
+        Args:
+            directories (List[str]): Directory paths to organize
+            workers (int): Number of directories organized at the same time
+            dry_run (bool): If True, only show what would be moved without actually moving files
+            
+        Returns:
+            Dict[str, Union[MovedFiles, Exception]]: organize_files result for each
+            directory, or the exception raised while organizing it
+        """
+        # First spelling of each distinct directory, keyed by its resolved path
+        unique: Dict[str, str] = {}
+        for directory in directories:
+            unique.setdefault(os.path.realpath(directory), directory)
+        
+        results: Dict[str, Union[MovedFiles, Exception]] = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                directory: executor.submit(cls(directory).organize_files, dry_run=dry_run, quiet=True)
+                for directory in unique.values()
+            }
+            for directory, future in futures.items():
+                try:
+                    moved_files = future.result()
+                except Exception as e:
+                    print(f"Error organizing {directory}: {e}")
+                    results[directory] = e
+                    continue
+                results[directory] = moved_files
+                if isinstance(moved_files, Counter):
+                    total = sum(moved_files.values())
+                else:
+                    total = sum(len(files) for files in moved_files.values())
+                action = "files to organize" if dry_run else "files organized"
+                print(f"{directory}: {total} {action}")
+        return results
+    
+    def iter_organized(self, dry_run: bool = False) -> Iterator[Tuple[str, str]]:
+        """
+        Organize files one at a time, yielding each result as it happens.
+        
+        Unlike organize_files, nothing is collected: each file is categorized
+        and moved as the directory is read, so memory use does not grow with
+        the number of files. Pair with print_summary_stream for a lean run.
+        The number of files found is only known once the scan ends, so the
+        status line organize_files prints up front is printed last here.
+        
+        Args:
+            dry_run (bool): If True, only yield where files would go without moving them
+            
+        Yields:
+            Tuple[str, str]: Category and file name of each moved file
+        """
+        if not dry_run:
+            self._dry_run_cache = None
+        
+        directory = str(self.directory)
+        folders: Dict[str, str] = {}
+        found = 0
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                found += 1
+                name = entry.name
+                category = _categorize_name(name)
+                if dry_run:
+                    yield category, name
+                    continue
+                try:
+                    folder = folders.get(category)
+                    if folder is None:
+                        folder = folders[category] = self._ensure_category_dir(directory, category)
+                    moved_to = _move_file(entry.path, os.path.join(folder, name))
+                except Exception as e:
+                    print(f"Error moving {name}: {e}")
+                    continue
+                yield category, os.path.basename(moved_to)
+        
+        self._print_found(found)
+    
+    def _organize_streaming(self, directory: str, max_workers: int, verbose: bool,
+                            semaphore: threading.BoundedSemaphore, counts_only: bool,
+                            quiet: bool) -> MovedFiles:
+        """
+        Organize files while the directory is still being scanned.
+        
+        The calling thread reads the directory and queues blocks of entries;
+        worker threads categorize and move each block as it arrives, so the
+        directory read overlaps with the renames. Useful for very large
+        directories or slow (network) filesystems.
+        
+        Args:
+            directory (str): Directory to organize
+            max_workers (int): Number of worker threads moving files
+            verbose (bool): If True, report every file as it is moved
+            semaphore (threading.BoundedSemaphore): Semaphore bounding concurrent moves
+            counts_only (bool): If True, workers only count moved files per category,
+                so memory stays proportional to the number of categories
+            quiet (bool): If True, do not print how many files the scan found
+            
+        Returns:
+            MovedFiles: Dictionary with categories and moved files, or a Counter
+            of files per category when counts_only is True
+        """
+        blocks: queue.SimpleQueue = queue.SimpleQueue()
+        worker_results = []
+        
+        def worker():
+            moved: list = []
+            counts: Counter = Counter()
+            lines: List[str] = []
+            folders: Dict[str, str] = {}
+            while True:
+                block = blocks.get()
+                if block is None:
+                    break
+                for name, source in block:
+                    category = _categorize_name(name)
+                    try:
+                        folder = folders.get(category)
+                        if folder is None:
+                            folder = folders[category] = self._ensure_category_dir(directory, category)
+                        destination = os.path.join(folder, name)
+                        moved_to = _move_file_limited(semaphore, source, destination)
+                    except Exception as e:
+                        print(f"Error moving {name}: {e}")
+                        continue
+                    name = os.path.basename(moved_to)
+                    if counts_only:
+                        counts[category] += 1
+                    else:
+                        moved.append((category, name))
+                    if verbose:
+                        lines.append(f"Moved: {name} -> {category}/")
+            worker_results.append((moved, counts, lines))
+        
+        threads = [threading.Thread(target=worker) for _ in range(max(1, max_workers))]
+        for thread in threads:
+            thread.start()
+        
+        found = 0
+        try:
+            with os.scandir(directory) as it:
+                block = []
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False):
+                        found += 1
+                        block.append((entry.name, entry.path))
+                        if len(block) == _SCAN_BLOCK_SIZE:
+                            blocks.put(block)
+                            block = []
+                if block:
+                    blocks.put(block)
+        finally:
+            for _ in threads:
+                blocks.put(None)
+            for thread in threads:
+                thread.join()
+        
+        if not quiet:
+            self._print_found(found)
+        total_counts: Counter = Counter()
+        names: DefaultDict[str, List[str]] = defaultdict(list)
+        for moved, counts, lines in worker_results:
+            total_counts.update(counts)
+            for category, name in moved:
+                names[category].append(name)
+            self._write_lines(lines)
+        return total_counts if counts_only else names
+    
+    @staticmethod
+    def _print_found(found: int) -> None:
+        """Print how many files the directory scan found."""
+        if found:
+            print(f"Found {found} files to organize...")
+        else:
+            print("No files found to organize.")
+    
+    @staticmethod
+    def _write_lines(lines: List[str]) -> None:
+        """Write buffered output lines to stdout with a single write call."""
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+    
+    def print_summary(self, moved_files: MovedFiles) -> None:
         """
         Print a summary of organized files.
         
         Args:
-            moved_files (Dict[str, List[str]]): Dictionary with categories and moved files
+            moved_files (MovedFiles): Dictionary with categories and moved files,
+                or a Counter of files per category (counts only, no file list)
         """
-        print("\n" + "="*50)
-        print("ORGANIZATION SUMMARY")
-        print("="*50)
+        # Build the whole report first and emit it with a single write
+        lines = ["\n" + "="*50, "ORGANIZATION SUMMARY", "="*50]
         
         total_files = 0
-        for category, files in moved_files.items():
-            if files:
-                print(f"\n{category}: {len(files)} files")
-                for file in files:
-                    print(f"  - {file}")
-                total_files += len(files)
+        if isinstance(moved_files, Counter):
+            for category, count in moved_files.items():
+                if count:
+                    lines.append(f"\n{category}: {count} files")
+                    total_files += count
+        else:
+            for category, files in moved_files.items():
+                if files:
+                    lines.append(f"\n{category}: {len(files)} files")
+                    lines.extend(f"  - {file}" for file in files)
+                    total_files += len(files)
         
-        print(f"\nTotal files organized: {total_files}")
+        lines.append(f"\nTotal files organized: {total_files}")
+        self._write_lines(lines)
+    
+    def print_summary_stream(self, moved: Iterable[Tuple[str, str]]) -> Counter:
+        """
+        Print a per-category count summary while consuming organize results.
+        
+        Args:
+            moved (Iterable[Tuple[str, str]]): (category, file name) pairs, e.g.
+                from iter_organized
+            
+        Returns:
+            Counter: Number of files per category
+        """
+        counts = Counter(category for category, _ in moved)
+        self.print_summary(counts)
+        return counts
+
+
+def _positive_int(value: str) -> int:
+    """
+    Parse a command line value that must be a whole number of at least 1.
+    
+    Args:
+        value (str): Raw command line value
+        
+    Returns:
+        int: Parsed value
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main():
@@ -155,6 +697,15 @@ def main():
     parser.add_argument("directory", help="Directory path to organize")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be moved without actually moving files")
     parser.add_argument("--create-folders", action="store_true", help="Create category folders without moving files")
+    parser.add_argument("--verbose", "-v", action="store_true", help="List every file as it is moved")
+    parser.add_argument("--jobs", "-j", type=_positive_int, default=1, help="Number of files to move concurrently (default: 1)")
+    parser.add_argument("--io-budget", type=_positive_int, default=None,
+                        help=f"Maximum concurrent moves when --jobs > 1 (default: {_DEFAULT_IO_BUDGET}); "
+                             "use a low value on NFS/SMB mounts")
+    parser.add_argument("--counts-only", action="store_true",
+                        help="Only report how many files went to each category, not their names")
+    parser.add_argument("--parallel-scan", action="store_true",
+                        help="Start moving files while the directory is still being read (uses --jobs workers)")
     
     args = parser.parse_args()
     
@@ -166,14 +717,19 @@ def main():
             print("Category folders created successfully!")
             return
         
-        # Create folders first
-        organizer.create_category_folders()
-        
-        # Organize files
-        moved_files = organizer.organize_files(dry_run=args.dry_run)
-        
-        # Print summary
-        organizer.print_summary(moved_files)
+        if args.counts_only and args.jobs <= 1 and not (args.parallel_scan or args.verbose):
+            # Only counts are needed, so stream results instead of collecting them
+            organizer.print_summary_stream(organizer.iter_organized(dry_run=args.dry_run))
+        else:
+            # Organize files
+            moved_files = organizer.organize_files(
+                dry_run=args.dry_run, max_workers=args.jobs, verbose=args.verbose,
+                parallel_scan=args.parallel_scan, io_budget=args.io_budget,
+                counts_only=args.counts_only
+            )
+            
+            # Print summary
+            organizer.print_summary(moved_files)
         
         if args.dry_run:
             print("\nThis was a dry run. No files were actually moved.")
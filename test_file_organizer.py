@@ -54,7 +54,6 @@ def test_file_organizer():
         # Test dry run
         print("\n🔍 Testing dry run...")
         organizer = FileOrganizer(str(test_dir))
-        organizer.create_category_folders()
         moved_files = organizer.organize_files(dry_run=True)
         
         # Show summary
@@ -5,10 +5,13 @@ Integration tests for FileOrganizer class.
 Tests the complete workflow with real file system operations.
 """
 
+import os
 import pytest
 import tempfile
 import shutil
+from collections import Counter
 from pathlib import Path
+from unittest.mock import patch
 from file_organizer import FileOrganizer
 
 
@@ -61,6 +64,211 @@ class TestFileOrganizerIntegration:
             original_path = self.temp_dir / filename
             assert not original_path.exists(), f"Original file {filename} still exists"
     
+    def test_parallel_workflow(self):
+        """Test file organization with several worker threads."""
+        test_files = [f"photo{i}.jpg" for i in range(20)] + [f"doc{i}.pdf" for i in range(20)]
+        for filename in test_files:
+            (self.temp_dir / filename).touch()
+
+        result = self.organizer.organize_files(max_workers=4)
+
+        assert sorted(result["Images"]) == sorted(f"photo{i}.jpg" for i in range(20))
+        assert sorted(result["Documents"]) == sorted(f"doc{i}.pdf" for i in range(20))
+        for filename in test_files:
+            assert not (self.temp_dir / filename).exists()
+        assert len(list((self.temp_dir / "Images").iterdir())) == 20
+        assert len(list((self.temp_dir / "Documents").iterdir())) == 20
+
+    def test_parallel_scan_workflow(self):
+        """Test organizing while the directory is still being scanned."""
+        test_files = [f"photo{i}.jpg" for i in range(30)] + [f"song{i}.mp3" for i in range(30)]
+        for filename in test_files:
+            (self.temp_dir / filename).touch()
+
+        with patch('file_organizer._SCAN_BLOCK_SIZE', 7):
+            result = self.organizer.organize_files(max_workers=3, parallel_scan=True)
+
+        assert sorted(result["Images"]) == sorted(f"photo{i}.jpg" for i in range(30))
+        assert sorted(result["Audio"]) == sorted(f"song{i}.mp3" for i in range(30))
+        for filename in test_files:
+            assert not (self.temp_dir / filename).exists()
+        created = sorted(p.name for p in self.temp_dir.iterdir() if p.is_dir())
+        assert created == ["Audio", "Images"]
+
+    @pytest.mark.parametrize("options", [
+        {},
+        {"dry_run": True},
+        {"max_workers": 3},
+        {"max_workers": 3, "parallel_scan": True},
+    ])
+    def test_counts_only(self, options):
+        """Test counts_only returns per-category counts for every organize mode."""
+        for i in range(5):
+            (self.temp_dir / f"photo{i}.jpg").touch()
+        (self.temp_dir / "notes.txt").touch()
+
+        result = self.organizer.organize_files(counts_only=True, **options)
+
+        assert result == Counter({"Images": 5, "Documents": 1})
+
+    def test_iter_organized_streams_moves(self, capsys):
+        """Test iter_organized moves files lazily and print_summary_stream counts them."""
+        for i in range(3):
+            (self.temp_dir / f"photo{i}.jpg").touch()
+        (self.temp_dir / "notes.txt").touch()
+
+        moves = self.organizer.iter_organized()
+        assert (self.temp_dir / "photo0.jpg").exists(), "Files moved before iteration started"
+
+        counts = self.organizer.print_summary_stream(moves)
+
+        assert counts == Counter({"Images": 3, "Documents": 1})
+        assert (self.temp_dir / "Images" / "photo0.jpg").exists()
+        assert (self.temp_dir / "Documents" / "notes.txt").exists()
+        assert "Total files organized: 4" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("create_file", [False, True])
+    def test_status_line_matches_across_modes(self, capsys, create_file):
+        """Test every organizing path prints the same scan status line."""
+        outputs = []
+        for run in (
+            lambda: self.organizer.organize_files(dry_run=True),
+            # Unchanged directory: served from the dry-run cache
+            lambda: self.organizer.organize_files(dry_run=True),
+            lambda: list(self.organizer.iter_organized(dry_run=True)),
+            lambda: self.organizer.organize_files(parallel_scan=True, max_workers=2),
+        ):
+            if create_file:
+                (self.temp_dir / "photo.jpg").touch()
+            run()
+            outputs.append(capsys.readouterr().out)
+
+        expected = "Found 1 files to organize..." if create_file else "No files found to organize."
+        assert all(expected in output for output in outputs)
+
+    def test_iter_organized_dry_run(self):
+        """Test iter_organized in dry run mode leaves the directory untouched."""
+        (self.temp_dir / "photo.jpg").touch()
+
+        assert list(self.organizer.iter_organized(dry_run=True)) == [("Images", "photo.jpg")]
+        assert (self.temp_dir / "photo.jpg").exists()
+        assert not (self.temp_dir / "Images").exists()
+
+    def test_bulk_organize(self):
+        """Test organizing several directories in one call."""
+        first = self.temp_dir / "first"
+        second = self.temp_dir / "second"
+        first.mkdir()
+        second.mkdir()
+        (first / "photo.jpg").touch()
+        (second / "song.mp3").touch()
+        (second / "notes.txt").touch()
+
+        results = FileOrganizer.bulk_organize([str(first), str(second)], workers=2)
+
+        assert results[str(first)]["Images"] == ["photo.jpg"]
+        assert results[str(second)]["Audio"] == ["song.mp3"]
+        assert results[str(second)]["Documents"] == ["notes.txt"]
+        assert (first / "Images" / "photo.jpg").exists()
+        assert (second / "Audio" / "song.mp3").exists()
+        assert (second / "Documents" / "notes.txt").exists()
+
+    def test_bulk_organize_reports_each_directory(self, capsys):
+        """Test bulk_organize prints one status line per directory, naming it."""
+        first = self.temp_dir / "first"
+        second = self.temp_dir / "second"
+        first.mkdir()
+        second.mkdir()
+        (first / "photo.jpg").touch()
+        (second / "song.mp3").touch()
+        (second / "notes.txt").touch()
+
+        FileOrganizer.bulk_organize([str(first), str(second)], workers=2)
+
+        out = capsys.readouterr().out
+        assert "Found" not in out
+        assert f"{first}: 1 files organized" in out
+        assert f"{second}: 2 files organized" in out
+
+    def test_bulk_organize_missing_directory(self):
+        """Test a failing directory is reported without losing the other results."""
+        first = self.temp_dir / "first"
+        first.mkdir()
+        (first / "photo.jpg").touch()
+        missing = str(self.temp_dir / "missing")
+
+        results = FileOrganizer.bulk_organize([str(first), missing, str(first)])
+
+        assert list(results) == [str(first), missing]
+        assert results[str(first)]["Images"] == ["photo.jpg"]
+        assert isinstance(results[missing], FileNotFoundError)
+        assert (first / "Images" / "photo.jpg").exists()
+
+    def test_only_used_category_folders_created(self):
+        """Test that organizing creates folders only for categories that receive files."""
+        (self.temp_dir / "report.pdf").touch()
+        (self.temp_dir / "notes.txt").touch()
+
+        self.organizer.organize_files()
+
+        created = sorted(p.name for p in self.temp_dir.iterdir() if p.is_dir())
+        assert created == ["Documents"]
+
+    def test_reassigned_directory(self):
+        """Test files are moved within the directory currently set on the organizer."""
+        first = self.temp_dir / "first"
+        second = self.temp_dir / "second"
+        first.mkdir()
+        second.mkdir()
+        (second / "photo.jpg").touch()
+
+        organizer = FileOrganizer(str(first))
+        organizer.directory = second
+        organizer.organize_files()
+
+        assert (second / "Images" / "photo.jpg").exists()
+        assert not (first / "Images").exists()
+
+    def test_existing_file_not_overwritten(self):
+        """Test a file from an earlier run is kept and the new one gets a numbered name."""
+        (self.temp_dir / "photo.jpg").write_text("old")
+        self.organizer.organize_files()
+        (self.temp_dir / "photo.jpg").write_text("new")
+
+        result = self.organizer.organize_files()
+
+        assert result["Images"] == ["photo_1.jpg"]
+        assert (self.temp_dir / "Images" / "photo.jpg").read_text() == "old"
+        assert (self.temp_dir / "Images" / "photo_1.jpg").read_text() == "new"
+        assert not (self.temp_dir / "photo.jpg").exists()
+
+    def test_destination_occupied_by_directory(self):
+        """Test a file is renamed when its destination name is taken by a directory."""
+        (self.temp_dir / "Images" / "photo.jpg").mkdir(parents=True)
+        (self.temp_dir / "Images" / "photo_1.jpg").touch()
+        (self.temp_dir / "photo.jpg").write_text("new")
+
+        result = self.organizer.organize_files()
+
+        assert result["Images"] == ["photo_2.jpg"]
+        assert (self.temp_dir / "Images" / "photo.jpg").is_dir()
+        assert (self.temp_dir / "Images" / "photo_2.jpg").read_text() == "new"
+        assert not (self.temp_dir / "photo.jpg").exists()
+
+    def test_destination_occupied_by_directory_keeps_pending_files(self):
+        """Test a renamed file never takes the name of a file still waiting to be moved."""
+        (self.temp_dir / "Images" / "photo.jpg").mkdir(parents=True)
+        (self.temp_dir / "photo.jpg").write_text("A")
+        (self.temp_dir / "photo_1.jpg").write_text("B")
+
+        result = self.organizer.organize_files()
+
+        assert sorted(result["Images"]) == ["photo_1.jpg", "photo_2.jpg"]
+        assert (self.temp_dir / "Images" / "photo_1.jpg").read_text() == "B"
+        assert (self.temp_dir / "Images" / "photo_2.jpg").read_text() == "A"
+        assert not (self.temp_dir / "photo.jpg").exists()
+        assert not (self.temp_dir / "photo_1.jpg").exists()
+
     def test_dry_run_integration(self):
         """Test dry run mode with real files."""
         # Create test files
@@ -86,6 +294,24 @@ class TestFileOrganizerIntegration:
             category_dir = self.temp_dir / category
             assert not category_dir.exists(), f"Category directory {category} was created during dry run"
     
+    def test_dry_run_reuses_plan_until_directory_changes(self):
+        """Test repeated dry runs skip the directory scan while the directory is unchanged."""
+        (self.temp_dir / "image.jpg").touch()
+        first = self.organizer.organize_files(dry_run=True)
+        first["Images"].append("mutated.jpg")
+
+        with patch('os.scandir', wraps=os.scandir) as mock_scandir:
+            second = self.organizer.organize_files(dry_run=True)
+            assert mock_scandir.call_count == 0
+            assert second["Images"] == ["image.jpg"]
+
+            (self.temp_dir / "document.pdf").touch()
+            # Force a distinct mtime even on filesystems with coarse timestamps
+            os.utime(self.temp_dir, ns=(0, 0))
+            third = self.organizer.organize_files(dry_run=True)
+            assert mock_scandir.call_count == 1
+            assert third["Documents"] == ["document.pdf"]
+
     def test_create_folders_only(self):
         """Test creating category folders without moving files."""
         # Create test files
@@ -149,6 +375,16 @@ class TestFileOrganizerIntegration:
         for category_files in result.values():
             assert category_files == []
     
+    @pytest.mark.parametrize("options", [{}, {"dry_run": True}, {"parallel_scan": True, "max_workers": 2}])
+    def test_missing_directory(self, options):
+        """Test organizing a directory that does not exist raises FileNotFoundError."""
+        organizer = FileOrganizer(str(self.temp_dir / "missing"))
+
+        with pytest.raises(FileNotFoundError):
+            organizer.organize_files(**options)
+        with pytest.raises(FileNotFoundError):
+            list(organizer.iter_organized())
+
     def test_directory_with_subdirectories(self):
         """Test that subdirectories are not affected."""
         # Create subdirectory with files
@@ -170,6 +406,22 @@ class TestFileOrganizerIntegration:
         subdir_file = subdir / "file_in_subdir.txt"
         assert subdir_file.exists(), "File in subdirectory was moved"
     
+    def test_symlinks_are_not_moved(self):
+        """Test that symbolic links are skipped, since files are detected without following links."""
+        target_dir = self.temp_dir / "subdirectory"
+        target_dir.mkdir()
+        (target_dir / "real.jpg").touch()
+        link = self.temp_dir / "link.jpg"
+        try:
+            link.symlink_to(target_dir / "real.jpg")
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not supported on this system")
+
+        result = self.organizer.organize_files()
+
+        assert "link.jpg" not in result["Images"]
+        assert link.is_symlink()
+
     def test_file_name_edge_cases(self):
         """Test files with special characters and edge cases."""
         edge_case_files = [
@@ -5,13 +5,31 @@ Unit tests for FileOrganizer class.
 Tests individual methods and functions in isolation using mocks.
 """
 
+import errno
+from collections import Counter
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import tempfile
 import shutil
+import threading
+import time
 
-from file_organizer import FileOrganizer
+from file_organizer import FileOrganizer, main
+
+
+def make_dir_entry(name, is_file=True):
+    """Build a mock os.DirEntry for the given file name."""
+    entry = Mock()
+    entry.name = name
+    entry.path = f"/mock/{name}"
+    entry.is_file.return_value = is_file
+    return entry
+
+
+def mock_scandir_entries(mock_scandir, entries):
+    """Make a patched os.scandir yield the given entries as a context manager."""
+    mock_scandir.return_value.__enter__.return_value = iter(entries)
 
 
 class TestFileOrganizerUnit:
@@ -33,6 +51,12 @@ class TestFileOrganizerUnit:
         assert 'Images' in self.organizer.file_extensions
         assert 'Documents' in self.organizer.file_extensions
     
+    def test_uses_slots(self):
+        """Test FileOrganizer instances do not carry a per-instance __dict__."""
+        assert not hasattr(self.organizer, '__dict__')
+        with pytest.raises(AttributeError):
+            self.organizer.unexpected_attribute = True
+    
     def test_get_file_extension_lowercase(self):
         """Test get_file_extension returns lowercase extension."""
         test_path = Path("test.JPG")
@@ -51,6 +75,13 @@ class TestFileOrganizerUnit:
         result = self.organizer.get_file_extension(test_path)
         assert result == ".txt"
     
+    @pytest.mark.parametrize("filename", [
+        "test.JPG", "testfile", "test.backup.txt", ".hidden", "archive.tar.GZ", "file.", "a..",
+    ])
+    def test_get_file_extension_name_matches_path(self, filename):
+        """Test get_file_extension gives the same result for a bare name and a Path."""
+        assert self.organizer.get_file_extension(filename) == self.organizer.get_file_extension(Path(filename))
+    
     @pytest.mark.parametrize("filename,expected_category", [
         ("image.jpg", "Images"),
         ("document.pdf", "Documents"),
@@ -73,7 +104,28 @@ class TestFileOrganizerUnit:
         test_path = Path("IMAGE.JPG")
         result = self.organizer.categorize_file(test_path)
         assert result == "Images"
-    
+
+    @pytest.mark.parametrize("name,expected_category", [
+        ("photo.jpg", "Images"),
+        ("REPORT.PDF", "Documents"),
+        ("file.with.dots.txt", "Documents"),
+        ("noextension", "Other"),
+        (".hidden", "Other"),
+        (".jpg", "Other"),
+        ("photo.jpg.", "Other"),
+    ])
+    def test_categorize_name(self, name, expected_category):
+        """Test categorization straight from a file name string."""
+        assert self.organizer.categorize_name(name) == expected_category
+        assert self.organizer.categorize_file(Path(name)) == expected_category
+
+    def test_categorize_file_every_known_extension(self):
+        """Test every configured extension maps back to its own category."""
+        for category, extensions in self.organizer.file_extensions.items():
+            for extension in extensions:
+                result = self.organizer.categorize_file(Path(f"file{extension}"))
+                assert result == category
+
     @patch('pathlib.Path.mkdir')
     def test_create_category_folders(self, mock_mkdir):
         """Test category folder creation."""
@@ -92,12 +144,10 @@ class TestFileOrganizerUnit:
         for call in mock_mkdir.call_args_list:
             assert call[1]['exist_ok'] is True
     
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.iterdir')
-    def test_organize_files_empty_directory(self, mock_iterdir, mock_exists):
+    @patch('os.scandir')
+    def test_organize_files_empty_directory(self, mock_scandir):
         """Test organize_files with empty directory."""
-        mock_exists.return_value = True
-        mock_iterdir.return_value = []
+        mock_scandir_entries(mock_scandir, [])
         
         result = self.organizer.organize_files()
         
@@ -105,33 +155,20 @@ class TestFileOrganizerUnit:
         for category_files in result.values():
             assert category_files == []
     
-    @patch('pathlib.Path.exists')
-    def test_organize_files_directory_not_exists(self, mock_exists):
+    @patch('os.scandir')
+    def test_organize_files_directory_not_exists(self, mock_scandir):
         """Test organize_files when directory doesn't exist."""
-        mock_exists.return_value = False
+        mock_scandir.side_effect = FileNotFoundError("No such file or directory")
         
         with pytest.raises(FileNotFoundError):
             self.organizer.organize_files()
     
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.iterdir')
-    @patch('shutil.move')
-    def test_organize_files_success(self, mock_move, mock_iterdir, mock_exists):
+    @patch('os.scandir')
+    @patch('os.unlink')
+    @patch('os.link')
+    def test_organize_files_success(self, mock_move, mock_unlink, mock_scandir):
         """Test successful file organization."""
-        mock_exists.return_value = True
-        
-        # Mock files
-        mock_file1 = Mock()
-        mock_file1.is_file.return_value = True
-        mock_file1.name = "test.jpg"
-        mock_file1.suffix = ".jpg"
-        
-        mock_file2 = Mock()
-        mock_file2.is_file.return_value = True
-        mock_file2.name = "test.pdf"
-        mock_file2.suffix = ".pdf"
-        
-        mock_iterdir.return_value = [mock_file1, mock_file2]
+        mock_scandir_entries(mock_scandir, [make_dir_entry("test.jpg"), make_dir_entry("test.pdf")])
         
         result = self.organizer.organize_files()
         
@@ -141,46 +178,121 @@ class TestFileOrganizerUnit:
         
         # Verify move was called
         assert mock_move.call_count == 2
+        assert mock_unlink.call_count == 2
     
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.iterdir')
-    def test_organize_files_dry_run(self, mock_iterdir, mock_exists):
+    @patch('os.scandir')
+    def test_organize_files_dry_run(self, mock_scandir):
         """Test organize_files in dry run mode."""
-        mock_exists.return_value = True
-        
-        # Mock files
-        mock_file = Mock()
-        mock_file.is_file.return_value = True
-        mock_file.name = "test.jpg"
-        mock_file.suffix = ".jpg"
-        mock_iterdir.return_value = [mock_file]
+        mock_scandir_entries(mock_scandir, [make_dir_entry("test.jpg")])
         
         result = self.organizer.organize_files(dry_run=True)
         
         # Verify file was categorized but not moved
         assert "test.jpg" in result["Images"]
     
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.iterdir')
+    @patch('os.scandir')
+    def test_organize_files_skips_non_files(self, mock_scandir):
+        """Test organize_files ignores entries that are not regular files."""
+        subdir = make_dir_entry("photos.jpg", is_file=False)
+        mock_scandir_entries(mock_scandir, [subdir])
+        
+        result = self.organizer.organize_files(dry_run=True)
+        
+        assert "photos.jpg" not in result["Images"]
+        subdir.is_file.assert_called_once_with(follow_symlinks=False)
+    
+    @patch('os.scandir')
     @patch('shutil.move')
-    def test_organize_files_move_error(self, mock_move, mock_iterdir, mock_exists):
+    @patch('os.link')
+    def test_organize_files_move_error(self, mock_move, mock_fallback, mock_scandir):
         """Test organize_files handles move errors gracefully."""
-        mock_exists.return_value = True
         mock_move.side_effect = OSError("Permission denied")
-        
-        # Mock files
-        mock_file = Mock()
-        mock_file.is_file.return_value = True
-        mock_file.name = "test.jpg"
-        mock_file.suffix = ".jpg"
-        mock_iterdir.return_value = [mock_file]
+        mock_fallback.side_effect = OSError("Permission denied")
+        mock_scandir_entries(mock_scandir, [make_dir_entry("test.jpg")])
         
         # Should not raise exception
         result = self.organizer.organize_files()
         
         # File should not be in results due to error
+        assert mock_move.call_count == 1
         assert "test.jpg" not in result["Images"]
     
+    @patch('os.scandir')
+    @patch('shutil.move')
+    @patch('os.link')
+    def test_organize_files_cross_device_fallback(self, mock_link, mock_move, mock_scandir):
+        """Test organize_files falls back to shutil.move for cross-device moves."""
+        mock_link.side_effect = OSError(errno.EXDEV, "Invalid cross-device link")
+        mock_scandir_entries(mock_scandir, [make_dir_entry("test.jpg")])
+        
+        result = self.organizer.organize_files()
+        
+        assert mock_move.call_count == 1
+        assert "test.jpg" in result["Images"]
+    
+    @patch('os.scandir')
+    @patch('os.unlink')
+    @patch('os.link')
+    def test_organize_files_verbose_output(self, mock_link, mock_unlink, mock_scandir, capsys):
+        """Test per-file lines are only reported in verbose mode."""
+        mock_scandir_entries(mock_scandir, [make_dir_entry("test.jpg")])
+        self.organizer.organize_files()
+        assert "Moved" not in capsys.readouterr().out
+        
+        mock_scandir_entries(mock_scandir, [make_dir_entry("test.jpg")])
+        self.organizer.organize_files(verbose=True)
+        assert "Moved: test.jpg -> Images/" in capsys.readouterr().out
+    
+    @patch('os.scandir')
+    @patch('os.makedirs')
+    def test_organize_files_dry_run_no_filesystem_writes(self, mock_makedirs, mock_scandir, capsys):
+        """Test dry run neither creates folders nor reports per-file lines."""
+        mock_scandir_entries(mock_scandir, [make_dir_entry("a.jpg"), make_dir_entry("b.jpg")])
+        
+        result = self.organizer.organize_files(dry_run=True, verbose=True)
+        
+        assert result["Images"] == ["a.jpg", "b.jpg"]
+        mock_makedirs.assert_not_called()
+        assert "Would move" not in capsys.readouterr().out
+    
+    @patch('os.scandir')
+    def test_organize_files_io_budget_limits_concurrency(self, mock_scandir):
+        """Test io_budget caps the number of moves in flight across worker threads."""
+        mock_scandir_entries(mock_scandir, [make_dir_entry(f"file{i}.jpg") for i in range(8)])
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+        
+        def slow_link(source, destination):
+            with lock:
+                in_flight.append(source)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(source)
+        
+        with patch('os.link', side_effect=slow_link), patch('os.unlink'):
+            result = self.organizer.organize_files(max_workers=4, io_budget=2)
+        
+        assert len(result["Images"]) == 8
+        assert max(peak) <= 2
+    
+    @pytest.mark.parametrize("io_budget", [0, -1])
+    def test_organize_files_rejects_invalid_io_budget(self, io_budget):
+        """Test an io_budget below 1 is rejected instead of falling back or deadlocking."""
+        with pytest.raises(ValueError, match="io_budget"):
+            self.organizer.organize_files(max_workers=4, io_budget=io_budget)
+    
+    @pytest.mark.parametrize("option", ["--io-budget", "--jobs"])
+    @pytest.mark.parametrize("value", ["0", "-1", "two"])
+    def test_main_rejects_invalid_concurrency(self, option, value, capsys):
+        """Test the CLI rejects concurrency options that are not positive integers."""
+        with patch('sys.argv', ['file_organizer.py', '.', option, value]):
+            with pytest.raises(SystemExit):
+                main()
+        
+        assert option in capsys.readouterr().err
+    
     def test_print_summary_empty(self, capsys):
         """Test print_summary with empty results."""
         empty_results = {category: [] for category in self.organizer.file_extensions.keys()}
@@ -191,6 +303,16 @@ class TestFileOrganizerUnit:
         captured = capsys.readouterr()
         assert "Total files organized: 0" in captured.out
     
+    def test_print_summary_counts_only(self, capsys):
+        """Test print_summary with per-category counts instead of file names."""
+        self.organizer.print_summary(Counter({'Images': 2, 'Documents': 1}))
+        
+        captured = capsys.readouterr()
+        assert "Images: 2 files" in captured.out
+        assert "Documents: 1 files" in captured.out
+        assert "Total files organized: 3" in captured.out
+        assert "  - " not in captured.out
+    
     def test_print_summary_with_files(self, capsys):
         """Test print_summary with files."""
         results = {
@@ -250,6 +372,15 @@ class TestFileOrganizerEdgeCases:
         # The modification should not persist
         assert 'NewCategory' not in organizer.file_extensions
         assert organizer.file_extensions == original_extensions
+    
+    def test_shared_extension_table_is_read_only(self):
+        """Test the extension table shared by all instances cannot be modified."""
+        import file_organizer
+        
+        with pytest.raises(TypeError):
+            file_organizer._EXTENSIONS['NewCategory'] = ('.new',)
+        
+        assert FileOrganizer("/a").file_extensions == FileOrganizer("/b").file_extensions
 
 
 @pytest.mark.unit